@@ -22,7 +22,7 @@ copyright = '2023, Toby Thurston'
 author = 'Toby Thurston'
 
 # The full version, including alpha/beta/rc tags
-release = '1.2.0'
+release = '2.0.0'
 
 
 # -- General configuration ---------------------------------------------------
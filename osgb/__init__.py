@@ -1,4 +1,5 @@
-from osgb.convert import grid_to_ll, ll_to_grid
-from osgb.gridder import (format_grid, get_sheet, map_locker,
-                          name_for_map_series, parse_grid, sheet_keys)
+from osgb.convert import grid_to_ll, grid_to_ll_array, ll_to_grid, ll_to_grid_array
+from osgb.gridder import (format_grid, format_grid_many, get_sheet, index_maps,
+                          map_locker, name_for_map_series, parse_grid,
+                          parse_grid_many, sheet_keys, sheet_keys_many)
 from osgb.legacy_interface import lonlat_to_osgb, osgb_to_lonlat
@@ -5,14 +5,35 @@ This module provides the core routines that implement the OS conversion
 formulae.
 
 """
-from __future__ import division, print_function, unicode_literals
-
 import array
+import functools
 import math
+import os
 import pkgutil
 import sys
 
-__all__ = ['grid_to_ll', 'll_to_grid']
+__all__ = ['grid_to_ll', 'grid_to_ll_array', 'll_to_grid', 'll_to_grid_array']
+
+# Performance notes
+#
+# - _project_kernel and _reverse_project_kernel are pure arithmetic on
+#   a handful of floats: a few trig calls and a few dozen multiplies.
+#   Under CPython their cost is bytecode dispatch, so what helps is fewer
+#   operations: hoisted constants and powers, no dict lookups, no divisions
+#   where a multiply will do.
+# - _find_OSTN_shifts_at reads four nodes from each of two 1.7 MB tables,
+#   so it is a scattered memory access, but again the cost that shows is
+#   the Python around it, not the reads themselves.
+# - _converge_OSTN is a data-dependent fixed-point loop; it is the inner
+#   loop of every WGS84 grid_to_ll, so it keeps the corners of its km cell
+#   between passes and only redoes the blend.
+# - Per-call overhead (argument checks, model lookup) is only worth
+#   attacking in bulk, which is what ll_to_grid_array is for.
+# - There is no separate array version of the OSTN lookup.  The batch
+#   functions call _ll_to_grid_point and _grid_to_ll_point for each point,
+#   which use _lookup_OSTN_shifts and _converge_OSTN just as the scalar
+#   functions do.  Without numpy an array lookup is the same Python loop
+#   with extra arrays to fill; for tracks, set OSGB_OSTN_CACHE instead.
 
 # The ellipsoid models for projection to and from the grid
 # each line has a, b, nu, ee
@@ -28,31 +49,104 @@ ELLIPSOID_MODELS = {
     'OSGB36': (6377563.396, 6356256.909, 0.0016732203289874942, 0.006670540074149134),
 }
 
+# Multiply by these rather than dividing by 57.29577951308232...
+DEG2RAD = math.pi / 180
+RAD2DEG = 180 / math.pi
+ARCSEC2RAD = DEG2RAD / 3600
+
+# The small Helmert transformation used outside the OSTN polygon, as
+# supplied by the OSGB: shifts tx, ty, tz in metres, the scale factor,
+# and rotations rx, ry, rz in radians.  Going the other way just negates
+# every parameter.
+HELMERT_TO_OSGB36 = (-446.448, +125.157, -542.060, 1 + 0.0000204894,
+                     -0.1502 * ARCSEC2RAD, -0.2470 * ARCSEC2RAD, -0.8421 * ARCSEC2RAD)
+HELMERT_TO_WGS84 = (+446.448, -125.157, +542.060, 1 - 0.0000204894,
+                    +0.1502 * ARCSEC2RAD, +0.2470 * ARCSEC2RAD, +0.8421 * ARCSEC2RAD)
+
+# and the ellipsoids they go between
+WGS84_ELLIPSOID = ELLIPSOID_MODELS['WGS84']
+OSGB36_ELLIPSOID = ELLIPSOID_MODELS['OSGB36']
+
 # The defining constants for the OSGB grid
-ORIGIN_LAMBDA = -2 / 57.29577951308232087679815481410517
-ORIGIN_PHI = 49 / 57.29577951308232087679815481410517
+ORIGIN_LAMBDA = -2 * DEG2RAD
+ORIGIN_PHI = 49 * DEG2RAD
 ORIGIN_EASTING = 400000.0
 ORIGIN_NORTHING = -100000.0
 CONVERGENCE_FACTOR = 0.9996012717
 
+
+def _meridian_arc_coefficients(b, n):
+    '''The factor, series coefficients, and constant term used by _compute_M,
+    followed by the coefficients of the series that inverts it.
+
+    These depend only on the ellipsoid, so they are worked out once for
+    each model here, rather than on every pass of the projection.
+
+    The OS formula has terms in sin(k * (phi - phi0)) * cos(k * (phi + phi0))
+    for k = 1, 2, 3; writing each as (sin(2k * phi) + sin(-2k * phi0)) / 2
+    leaves a constant part that we can add up now, and the coefficients
+    are halved to match.
+    '''
+    c1 = 1 + n * (1 + 5 / 4 * n * (1 + n))
+    c2 = 3 * n * (1 + n * (1 + 7 / 8 * n)) / 2
+    c3 = 15 / 8 * n * (n * (1 + n)) / 2
+    c4 = 35 / 24 * n * n * n / 2
+    c0 = (-c2 * math.sin(-2 * ORIGIN_PHI)
+          + c3 * math.sin(-4 * ORIGIN_PHI)
+          - c4 * math.sin(-6 * ORIGIN_PHI))
+
+    # Krueger's series for latitude in terms of the rectifying latitude
+    d2 = 3 / 2 * n - 27 / 32 * n ** 3
+    d4 = 21 / 16 * n ** 2 - 55 / 32 * n ** 4
+    d6 = 151 / 96 * n ** 3
+    d8 = 1097 / 512 * n ** 4
+    return (CONVERGENCE_FACTOR * b, c0, c1, c2, c3, c4, d2, d4, d6, d8)
+
+
+# The ellipsoid models in the form the projection kernels want them:
+# a scaled by the convergence factor, ee, and the meridian arc coefficients
+PROJECTION_PARAMS = {
+    name: (a * CONVERGENCE_FACTOR, e2, _meridian_arc_coefficients(b, n))
+    for name, (a, b, n, e2) in ELLIPSOID_MODELS.items()
+}
+
+# and bound to names, so that the fixed uses of each model skip the dict
+WGS84_PARAMS = PROJECTION_PARAMS['WGS84']
+OSGB36_PARAMS = PROJECTION_PARAMS['OSGB36']
+
 # OSTN data
-# Arrays of bytes are handled one way in Python3...
-if sys.version_info > (3, 0):
-    OSTN_EE_SHIFTS = array.array('H')
-    OSTN_EE_SHIFTS.frombytes(pkgutil.get_data("osgb", "ostn_east_shift_82140"))
-    OSTN_NN_SHIFTS = array.array('H')
-    OSTN_NN_SHIFTS.frombytes(pkgutil.get_data("osgb", "ostn_north_shift_-84180"))
-
-# ... and another in Python2
-else:
-    OSTN_EE_SHIFTS = array.array(b'H')
-    OSTN_EE_SHIFTS.fromstring(pkgutil.get_data("osgb", "ostn_east_shift_82140"))
-    OSTN_NN_SHIFTS = array.array(b'H')
-    OSTN_NN_SHIFTS.fromstring(pkgutil.get_data("osgb", "ostn_north_shift_-84180"))
+OSTN_EE_SHIFTS = array.array('H')
+OSTN_EE_SHIFTS.frombytes(pkgutil.get_data("osgb", "ostn_east_shift_82140"))
+OSTN_NN_SHIFTS = array.array('H')
+OSTN_NN_SHIFTS.frombytes(pkgutil.get_data("osgb", "ostn_north_shift_-84180"))
+
+# The files hold one little-endian unsigned 16-bit offset in mm per km node,
+# which is already as compact as the data allow, but array reads them in
+# native order, so swap them round on a big-endian machine.
+if sys.byteorder == 'big':
+    OSTN_EE_SHIFTS.byteswap()
+    OSTN_NN_SHIFTS.byteswap()
 
 OSTN_EE_BASE = 82140
 OSTN_NN_BASE = -84180
 
+# There is a node every km, in rows of OSTN_COLUMNS from the SW corner,
+# so the shifts can be interpolated for 0 < E < OSTN_E_MAX, 0 < N < OSTN_N_MAX
+OSTN_COLUMNS = 701
+OSTN_ROWS = len(OSTN_EE_SHIFTS) // OSTN_COLUMNS
+OSTN_E_MAX = (OSTN_COLUMNS - 1) * 1000
+OSTN_N_MAX = (OSTN_ROWS - 1) * 1000
+
+# Set OSGB_OSTN_CACHE in the environment to the number of OSTN km cells
+# whose corner shifts should be memoized (eg 4096).  This pays off for dense
+# sequences of points such as GPS tracks, but is just overhead when points
+# rarely repeat, so it is off by default.  Anything that is not a positive
+# whole number leaves it off.
+try:
+    OSTN_CACHE_SIZE = max(0, int(os.environ.get('OSGB_OSTN_CACHE', 0)))
+except ValueError:
+    OSTN_CACHE_SIZE = 0
+
 
 class Error(Exception):
     """Parent class for exceptions in this module"""
@@ -87,7 +181,7 @@ class MissingArgumentError(Error):
         return "This should have been a tuple: {}".format(self.arg)
 
 
-def grid_to_ll(easting, northing=None, model='WGS84', rounding=None):
+def grid_to_ll(easting, northing=None, model='WGS84', rounding=None, ostn=True):
     """
     Convert OSGB (easting, northing) to latitude and longitude.
 
@@ -189,6 +283,14 @@ def grid_to_ll(easting, northing=None, model='WGS84', rounding=None):
 
     But beware that this only works for the area immediately around the British Isles.
 
+    Outside OSTN15 the WGS84 conversion uses a Helmert transformation that
+    is only good to about 5m.  As with ``ll_to_grid`` you can ask for that
+    approximation everywhere with ``ostn=False``, which skips the search for
+    the OSTN shifts.
+
+    >>> grid_to_ll(217380, 896060, ostn=False)
+    (57.916399, -5.084588)
+
     """
     if model not in ELLIPSOID_MODELS:
         raise UndefinedModelError(model)
@@ -199,50 +301,60 @@ def grid_to_ll(easting, northing=None, model='WGS84', rounding=None):
         else:
             raise MissingArgumentError(easting)
 
-    def _appd(input):
-        "Find appropriate decimals for this coordinate"
-        s = '{:.3f}'.format(input)
-        return 6 if s.endswith('.000') else 9
+    decimals = rounding if type(rounding) is int else _appropriate_decimals(easting, northing)
+    (lat, lon) = _grid_to_ll_point(easting, northing, model, ostn)
+    return (round(lat, decimals), round(lon, decimals))
 
-    decimals = rounding if type(rounding) is int else max(_appd(easting), _appd(northing))
 
-    (os_lat, os_lon) = _reverse_project_onto_ellipsoid(easting, northing, 'OSGB36')
+def grid_to_ll_array(eastings, northings, model='WGS84', rounding=None, out=None, ostn=True):
+    """Convert sequences of OSGB eastings and northings to latitudes and longitudes.
 
-    # if we want OS map LL we are done
-    if model == 'OSGB36':
-        return (round(os_lat, decimals), round(os_lon, decimals))
+    This is the batch version of :py:func:`grid_to_ll`.  Each point is
+    treated exactly as ``grid_to_ll`` would treat it, including the
+    choice of default rounding according to the decimal places in that
+    point, but the model is checked only once, and the results come back
+    as two ``array.array('d')`` objects, one of latitudes and one of
+    longitudes.
 
-    # If we want WGS84 LL, we must adjust to pseudo grid if we can
-    shifts = _find_OSTN_shifts_at(easting, northing)
-    if shifts is not None:
-        in_ostn_polygon = True
-        x = easting - shifts[0]
-        y = northing - shifts[1]
-        last_shifts = shifts[:]
-        for _ in range(20):
-            shifts = _find_OSTN_shifts_at(x, y)
+    >>> (lats, lons) = grid_to_ll_array([217380, 323223], [896060, 1004000], model='OSGB36')
+    >>> list(lats)
+    [57.916716, 58.916802]
+    >>> list(lons)
+    [-5.08333, -3.333332]
 
-            if shifts is None:
-                # we have been shifted off the edge
-                in_ostn_polygon = False
-                break
+    >>> (lats, lons) = grid_to_ll_array([217380, -100], [896060, -100], rounding=8)
+    >>> list(zip(lats, lons))
+    [(57.91637756, -5.08458795), (49.76584553, -7.55843918)]
 
-            x = easting - shifts[0]
-            y = northing - shifts[1]
-            if abs(shifts[0] - last_shifts[0]) < 0.0001:
-                if abs(shifts[1] - last_shifts[1]) < 0.0001:
-                    break
+    As with :py:func:`ll_to_grid_array` you can pass a pair of sequences
+    as ``out`` to have the results written into them instead, and as with
+    ``grid_to_ll`` you can add ``ostn=False`` to use the Helmert
+    approximation for every point.
 
-            last_shifts = shifts[:]
+    >>> (lats, lons) = grid_to_ll_array([217380], [896060], ostn=False)
+    >>> list(zip(lats, lons))
+    [(57.916399, -5.084588)]
 
-        if in_ostn_polygon:
-            return tuple(round(x, decimals) for x in _reverse_project_onto_ellipsoid(x, y, 'WGS84'))
+    """
+    if model not in ELLIPSOID_MODELS:
+        raise UndefinedModelError(model)
+
+    (lats, lons) = (array.array('d'), array.array('d')) if out is None else out
+    for i, (easting, northing) in enumerate(zip(eastings, northings)):
+        decimals = rounding if type(rounding) is int else _appropriate_decimals(easting, northing)
+        (lat, lon) = _grid_to_ll_point(easting, northing, model, ostn)
+
+        if out is None:
+            lats.append(round(lat, decimals))
+            lons.append(round(lon, decimals))
+        else:
+            lats[i] = round(lat, decimals)
+            lons[i] = round(lon, decimals)
 
-    # If we get here, we must use the Helmert approx
-    return tuple(round(x, decimals) for x in _shift_ll_from_osgb36_to_wgs84(os_lat, os_lon))
+    return (lats, lons)
 
 
-def ll_to_grid(lat, lon, model='WGS84', rounding=None):
+def ll_to_grid(lat, lon, model='WGS84', rounding=None, ostn=True):
     """Convert a (latitude, longitude) pair to an OSGB grid (easting, northing) pair.
 
     Output
@@ -267,10 +379,6 @@ def ll_to_grid(lat, lon, model='WGS84', rounding=None):
         >>> ll_to_grid(52 + 39/60 + 27.2531/3600, 1 + 43/60 + 4.5177/3600, model='OSGB36')
         (651409.903, 313177.27)
 
-        But if you are still using python2 then be sure to ``import
-        division`` so that you get the correct semantics for division
-        when both numerator and denominator are integers.
-
     If you have trouble remembering the order of the arguments, or the
     returned values, note that latitude comes before longitude in the
     alphabet too, as easting comes before northing.  However since
@@ -357,6 +465,16 @@ def ll_to_grid(lat, lon, model='WGS84', rounding=None):
             ...
         UndefinedModelError: EDM50
 
+    Outside the area covered by OSTN15, WGS84 coordinates are converted
+    with a Helmert transformation instead, which is only good to about 5m,
+    so the results are rounded to whole metres.  If you know that your
+    points are outside that area, or you don't need more accuracy than
+    that, add ``ostn=False`` to go straight to the Helmert approximation
+    and save a little work.
+
+        >>> ll_to_grid(52, -2, ostn=False)
+        (400097.0, 233506.0)
+
     You can also control the rounding directly if you need to, but be
     aware that asking for more decimal places does not make the
     conversion any more accurate; the formulae used are only designed to
@@ -383,53 +501,175 @@ def ll_to_grid(lat, lon, model='WGS84', rounding=None):
 
     """
 
-    if lat < lon:
-        (lat, lon) = (lon, lat)
+    params = PROJECTION_PARAMS.get(model)
+    if params is None:
+        raise UndefinedModelError(model)
 
-    if model not in ELLIPSOID_MODELS:
+    (easting, northing, default_decimals) = _ll_to_grid_point(lat, lon, model, params, ostn)
+    decimals = rounding if type(rounding) is int else default_decimals
+    return (round(easting, decimals), round(northing, decimals))
+
+
+def ll_to_grid_array(lats, lons, model='WGS84', rounding=None, out=None, ostn=True):
+    """Convert sequences of latitudes and longitudes to OSGB eastings and northings.
+
+    This is the batch version of :py:func:`ll_to_grid`, for when you have
+    a whole track or a column of points to convert.  Each point is treated
+    exactly as ``ll_to_grid`` would treat it, but the model is checked
+    only once, and the results come back as two ``array.array('d')``
+    objects, one of eastings and one of northings, rather than as a list
+    of pairs.
+
+    >>> (ee, nn) = ll_to_grid_array([51.5, 52, 61.3], [-2.1, -2, 0])
+    >>> list(ee)
+    [393154.813, 400096.274, 507242.0]
+    >>> list(nn)
+    [177900.607, 233505.403, 1270342.0]
+
+    The arguments can be any iterables of numbers, and the optional
+    ``model``, ``rounding``, and ``ostn`` arguments work as they do for
+    ``ll_to_grid``.
+
+    >>> (ee, nn) = ll_to_grid_array((52, 49), (-2, -2), model='OSGB36')
+    >>> list(zip(ee, nn))
+    [(400000.0, 233553.731), (400000.0, -100000.0)]
+
+    >>> (ee, nn) = ll_to_grid_array([52], [-2], ostn=False)
+    >>> list(zip(ee, nn))
+    [(400097.0, 233506.0)]
+
+    If the two sequences are different lengths, the extra items in the
+    longer one are ignored.
+
+    If you already have somewhere to put the results, such as a pair of
+    preallocated arrays, pass them as ``out`` and they will be filled in
+    place, from the start, and returned instead of new arrays.  They must
+    be at least as long as the input.
+
+    >>> buffers = (array.array('d', [0, 0]), array.array('d', [0, 0]))
+    >>> (ee, nn) = ll_to_grid_array([52, 49], [-2, -2], model='OSGB36', out=buffers)
+    >>> ee is buffers[0]
+    True
+    >>> list(zip(*buffers))
+    [(400000.0, 233553.731), (400000.0, -100000.0)]
+
+    """
+    params = PROJECTION_PARAMS.get(model)
+    if params is None:
         raise UndefinedModelError(model)
 
-    easting, northing = _project_onto_grid(lat, lon, model)
+    (eastings, northings) = (array.array('d'), array.array('d')) if out is None else out
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        (easting, northing, decimals) = _ll_to_grid_point(lat, lon, model, params, ostn)
+        if type(rounding) is int:
+            decimals = rounding
 
-    default_decimals = 3
-    if model == 'WGS84':
-        shifts = _find_OSTN_shifts_at(easting, northing)
-        if shifts is not None:
-            easting += shifts[0]
-            northing += shifts[1]
+        if out is None:
+            eastings.append(round(easting, decimals))
+            northings.append(round(northing, decimals))
         else:
-            (osgb_lat, osgb_lon) = _shift_ll_from_wgs84_to_osgb36(lat, lon)
-            (easting, northing) = _project_onto_grid(osgb_lat, osgb_lon, 'OSGB36')
-            default_decimals = 0
+            eastings[i] = round(easting, decimals)
+            northings[i] = round(northing, decimals)
 
-    decimals = rounding if type(rounding) is int else default_decimals
-    return (round(easting, decimals), round(northing, decimals))
+    return (eastings, northings)
 
 
-def _compute_M(phi, model):
+def _appropriate_decimals(easting, northing):
+    '''Find appropriate decimals for the lat/lon of this grid point.
+
+    Whole metres get 6 places, anything finer gets 9.
+
+    >>> _appropriate_decimals(217380, 896060)
+    6
+    >>> _appropriate_decimals(217380, 896060.25)
+    9
+    '''
+    if '{:.3f}'.format(easting).endswith('.000') and '{:.3f}'.format(northing).endswith('.000'):
+        return 6
+    return 9
+
+
+def _grid_to_ll_point(easting, northing, model, ostn):
+    '''Convert one grid point to an unrounded (lat, lon) in the given model.
+
+    This is the arithmetic shared by grid_to_ll and grid_to_ll_array.
+
+    >>> print('{:.9f} {:.9f}'.format(*_grid_to_ll_point(217380, 896060, 'WGS84', True)))
+    57.916377564 -5.084587951
+    '''
+    if model == 'WGS84':
+        # adjust to the pseudo grid if we can, else use the Helmert approx
+        pseudo = _converge_OSTN(easting, northing) if ostn else None
+        if pseudo is not None:
+            return _reverse_project_kernel(pseudo[0], pseudo[1], *WGS84_PARAMS)
+        return _shift_ll_from_osgb36_to_wgs84(*_reverse_project_kernel(easting, northing, *OSGB36_PARAMS))
+
+    return _reverse_project_kernel(easting, northing, *OSGB36_PARAMS)
+
+
+def _ll_to_grid_point(lat, lon, model, params, ostn):
+    '''Convert one (lat, lon) to an unrounded (easting, northing, default_decimals).
+
+    This is the arithmetic shared by ll_to_grid and ll_to_grid_array.
+    ``params`` is the entry for ``model`` from PROJECTION_PARAMS.  The
+    default decimals are 3 (mm) for points that could be shifted with
+    OSTN15, and 0 for points done with the Helmert approximation.
+
+    >>> print('{:.4f} {:.4f} {}'.format(*_ll_to_grid_point(52, -2, 'WGS84', WGS84_PARAMS, True)))
+    400096.2738 233505.4033 3
+    >>> print('{:.0f} {:.0f} {}'.format(*_ll_to_grid_point(52, -2, 'WGS84', WGS84_PARAMS, False)))
+    400097 233506 0
+    '''
+    # Accept the arguments in either order.  A plain compare costs less
+    # than max and min, and ll_to_grid_array gets the same swap per point.
+    if lat < lon:
+        (lat, lon) = (lon, lat)
+
+    if model == 'WGS84':
+        if ostn:
+            (easting, northing) = _project_kernel(lat, lon, *params)
+            shifts = _lookup_OSTN_shifts(easting, northing)
+            if shifts is not None:
+                return (easting + shifts[0], northing + shifts[1], 3)
+        (osgb_lat, osgb_lon) = _shift_ll_from_wgs84_to_osgb36(lat, lon)
+        return _project_kernel(osgb_lat, osgb_lon, *OSGB36_PARAMS) + (0,)
+
+    return _project_kernel(lat, lon, *params) + (3,)
+
+
+def _compute_M(phi, sp, cp, arc):
     '''Compute the first term of the solution given phi.
 
-    Uses the ellipsoid constants (so needs the model name)
+    The caller passes sin and cos of phi, which it generally needs anyway,
+    and the meridian arc coefficients of the ellipsoid, as prepared in
+    PROJECTION_PARAMS.  The sines of 2, 4, and 6 phi follow from those
+    by the double angle formulae and the recurrence
+    sin((k+1)x) = 2 cos(x) sin(kx) - sin((k-1)x), so there are no more
+    calls to math here.
+
+    >>> phi = 52 * DEG2RAD
+    >>> print("{:.6f}".format(_compute_M(phi, math.sin(phi), math.cos(phi), OSGB36_PARAMS[2])))
+    333553.731330
+
     '''
-    p_plus = phi + ORIGIN_PHI
-    p_minus = phi - ORIGIN_PHI
-    _, b, n, _ = ELLIPSOID_MODELS[model]
-
-    return CONVERGENCE_FACTOR * b * (
-        (1 + n * (1 + 5 / 4 * n * (1 + n))) * p_minus
-        - 3 * n * (1 + n * (1 + 7 / 8 * n)) * math.sin(p_minus) * math.cos(p_plus)
-        + (15 / 8 * n * (n * (1 + n))) * math.sin(2 * p_minus) * math.cos(2 * p_plus)
-        - 35 / 24 * n * n * n * math.sin(3 * p_minus) * math.cos(3 * p_plus)
-    )
+    (bf, c0, c1, c2, c3, c4, _, _, _, _) = arc
+    sin2 = 2 * sp * cp
+    cos2 = 1 - 2 * sp * sp
+    sin4 = 2 * sin2 * cos2
+    sin6 = 2 * cos2 * sin4 - sin2
 
+    return bf * (c1 * (phi - ORIGIN_PHI) + c0 - c2 * sin2 + c3 * sin4 - c4 * sin6)
 
-def _project_onto_grid(lat, lon, model):
+
+def _project_kernel(lat, lon, af, e2, arc):
     '''Project spherical coordinates (lat, lon) onto a flat grid.
 
     This is the core bit of arithmetic, following the OSGB reference
     implementation.  The strange variable names (I, II, III, etc) follow
     those used in the OSGB notes, except that M is used instead of I to
-    keep flake8 happy.
+    keep flake8 happy.  The ellipsoid is given as the plain numbers from
+    PROJECTION_PARAMS, so the hot path is nothing but scalar floating
+    point arithmetic.
 
     We are essentially using a Taylor polynomial expansion, and the
     accuracy of this projection is limited by the number of terms
@@ -439,99 +679,122 @@ def _project_onto_grid(lat, lon, model):
     This routine is not meant to be called by the user.  Use
     ll_to_grid() instead.
 
-    >>> _project_onto_grid(52, -2, 'OSGB36')
-    (400000.0, 233553.73133031745)
+    >>> _project_kernel(52, -2, *OSGB36_PARAMS)
+    (400000.0, 233553.73133031809)
 
     '''
-
-    phi = lat / 57.29577951308232087679815481410517
+    phi = lat * DEG2RAD
     cp = math.cos(phi)
     sp = math.sin(phi)
     tp = sp / cp  # cos phi cannot be zero in GB
 
-    a, _, _, e2 = ELLIPSOID_MODELS[model]
+    # powers that are used more than once below
+    cp3 = cp * cp * cp
+    cp5 = cp3 * cp * cp
+    tp2 = tp * tp
+    splat = 1 - e2 * sp * sp
 
-    M = _compute_M(phi, model)
+    M = _compute_M(phi, sp, cp, arc)
 
-    nu = CONVERGENCE_FACTOR * a / math.sqrt(1 - e2 * sp * sp)
-    etasq = (1 - e2 * sp * sp) / (1 - e2) - 1
+    nu = af / math.sqrt(splat)
+    etasq = splat / (1 - e2) - 1
 
     II = nu / 2 * sp * cp
-    III = nu / 24 * sp * cp**3 * (5 - tp * tp + 9 * etasq)
-    IIIA = nu / 720 * sp * cp**5 * (61 + (-58 + tp * tp) * tp * tp)
+    III = nu / 24 * sp * cp3 * (5 - tp2 + 9 * etasq)
+    IIIA = nu / 720 * sp * cp5 * (61 + (-58 + tp2) * tp2)
 
     IV = nu * cp
-    V = nu / 6 * cp**3 * (etasq + 1 - tp * tp)
-    VI = nu / 120 * cp**5 * (5 + (-18 + tp * tp) * tp * tp + 14 * etasq - 58 * tp * tp * etasq)
+    V = nu / 6 * cp3 * (etasq + 1 - tp2)
+    VI = nu / 120 * cp5 * (5 + (-18 + tp2) * tp2 + 14 * etasq - 58 * tp2 * etasq)
 
-    dl = lon / 57.29577951308232087679815481410517 - ORIGIN_LAMBDA
-    north = ORIGIN_NORTHING + M + (II + (III + IIIA * dl * dl) * dl * dl) * dl * dl
-    east = ORIGIN_EASTING + (IV + (V + VI * dl * dl) * dl * dl) * dl
+    dl = lon * DEG2RAD - ORIGIN_LAMBDA
+    dl2 = dl * dl
+    north = ORIGIN_NORTHING + M + (II + (III + IIIA * dl2) * dl2) * dl2
+    east = ORIGIN_EASTING + (IV + (V + VI * dl2) * dl2) * dl
 
     # return them with easting first
     return (east, north)
 
 
-def _reverse_project_onto_ellipsoid(easting, northing, model):
+def _reverse_project_kernel(easting, northing, af, e2, arc):
     '''Un-project from the grid plane back on to the globe.
 
     This is the core arithmetic for the reverse projection.  Don't use
     this directly.  Use grid_to_ll instead.
 
-    The strange variable names follow (roughly) the OSGB formulae.  The
-    accuracy is limited by the number of terms in the final expansions,
-    and the speed by the fact that this has to be an iterative process.
+    The terms VII to XIIA are the ones in the OSGB formulae, and the
+    accuracy is limited by the number of them in the final expansions.
+    They are built from tan, sec, nu, rho, and eta squared as in the OSGB
+    notes, but nu and rho are not computed themselves; the comments below
+    give each of the quantities that stand in for them in OSGB terms.
 
-    >>> _reverse_project_onto_ellipsoid(400000.0, 233553.731330343, 'OSGB36')
-    (52.0, -2.0)
+    >>> (lat, lon) = _reverse_project_kernel(400000.0, 233553.731330343, *OSGB36_PARAMS)
+    >>> print('{:.12f} {:.12f}'.format(lat, lon))
+    52.000000000000 -2.000000000000
 
-    >>> (lat, lon) = _reverse_project_onto_ellipsoid(651409.903, 313177.270, 'OSGB36')
+    >>> (lat, lon) = _reverse_project_kernel(651409.903, 313177.270, *OSGB36_PARAMS)
     >>> print('{:.8f} {:.8f}'.format(lat, lon))
     52.65757030 1.71792158
 
     '''
-
-    e2 = ELLIPSOID_MODELS[model][3]
-    af = ELLIPSOID_MODELS[model][0] * CONVERGENCE_FACTOR
-
     dn = northing - ORIGIN_NORTHING
     de = easting - ORIGIN_EASTING
 
-    phi = ORIGIN_PHI + dn / af
-
-    while True:
-        M = _compute_M(phi, model)
-        if abs(dn - M) < 0.00001:  # HUNDREDTH_MM
-            break
-        phi = phi + (dn - M) / af
+    # Instead of iterating on M until it matches dn, as the OS notes do,
+    # go straight to the latitude with Krueger's series.  That series inverts
+    # the exact meridian arc, which the OS formula for M matches only to
+    # about 0.1mm, so finish with one step of the usual correction, which
+    # leaves dn - M well under the OS tolerance of 0.01mm.
+    (bf, c0, c1, _, _, _, d2, d4, d6, d8) = arc
+    mu = (dn / bf - c0) / c1 + ORIGIN_PHI
+    sin2 = math.sin(2 * mu)
+    cos2x2 = 2 * math.cos(2 * mu)
+    sin4 = cos2x2 * sin2
+    sin6 = cos2x2 * sin4 - sin2
+    sin8 = cos2x2 * sin6 - sin4
+    phi = mu + d2 * sin2 + d4 * sin4 + d6 * sin6 + d8 * sin8
+
+    phi = phi + (dn - _compute_M(phi, math.sin(phi), math.cos(phi), arc)) / af
 
     cp = math.cos(phi)
     sp = math.sin(phi)
     tp = sp / cp  # math.cos phi cannot be zero in GB
-
+    tp2 = tp * tp
+
+    # In the OSGB notes nu = af / sqrt(splat) and rho = af (1 - e2) / splat**1.5,
+    # but the terms only need these combinations of them, which mostly need
+    # no square root:
+    #   inu2 = 1 / nu**2
+    #   inu4 = 1 / nu**4
+    #   nu_rho = nu / rho
+    #   etasq = nu / rho - 1, which is eta squared in the OSGB notes
+    #   tp_rho_nu = tan(phi) / (rho nu)
     splat = 1 - e2 * sp * sp
-    sqrtsplat = math.sqrt(splat)
-    nu = af / sqrtsplat
-    rho = af * (1 - e2) / (splat * sqrtsplat)
-    etasq = nu / rho - 1
-
-    VII = tp / (2 * rho * nu)
-    VIII = (5 + 3 * tp * tp + etasq - 9 * tp * tp * etasq) * tp / (24 * rho * nu**3)
-    IX = (61 + (90 + 45 * tp * tp) * tp * tp) * tp / (720 * rho * nu**5)
-
-    secp = 1 / cp
-
-    X = secp / nu
-    XI = secp / (6 * nu**3) * (nu / rho + 2 * tp * tp)
-    XII = secp / (120 * nu**5) * (5 + (28 + 24 * tp * tp) * tp * tp)
-    XIIA = secp / (5040 * nu**7) * (61 + (662 + (1320 + 720 * tp * tp) * tp * tp) * tp * tp)
-
-    phi = phi + (-VII + (VIII - IX * de * de) * de * de) * de * de
-    lam = ORIGIN_LAMBDA + (X + (-XI + (XII - XIIA * de * de) * de * de) * de * de) * de
+    inu2 = splat / (af * af)
+    inu4 = inu2 * inu2
+    nu_rho = splat / (1 - e2)
+    etasq = nu_rho - 1
+    tp_rho_nu = tp * inu2 * nu_rho
+
+    # VII = tan(phi) / (2 rho nu), VIII and IX have 1/nu**2 and 1/nu**4 more
+    VII = tp_rho_nu / 2
+    VIII = (5 + 3 * tp2 + etasq - 9 * tp2 * etasq) * tp_rho_nu * inu2 / 24
+    IX = (61 + (90 + 45 * tp2) * tp2) * tp_rho_nu * inu4 / 720
+
+    # X = sec(phi) / nu, and XI, XII, XIIA have 1/nu**2, 1/nu**4, 1/nu**6 more;
+    # in XI, nu/rho + 2 tan**2 is written as etasq + 1 + 2 tp2
+    X = math.sqrt(splat) / (cp * af)
+    XI = X * inu2 / 6 * (etasq + 1 + 2 * tp2)
+    XII = X * inu4 / 120 * (5 + (28 + 24 * tp2) * tp2)
+    XIIA = X * inu4 * inu2 / 5040 * (61 + (662 + (1320 + 720 * tp2) * tp2) * tp2)
+
+    de2 = de * de
+    phi = phi + (-VII + (VIII - IX * de2) * de2) * de2
+    lam = ORIGIN_LAMBDA + (X + (-XI + (XII - XIIA * de2) * de2) * de2) * de
 
     # now put into degrees & return
-    return (phi * 57.29577951308232087679815481410517,
-            lam * 57.29577951308232087679815481410517)
+    return (phi * RAD2DEG,
+            lam * RAD2DEG)
 
 
 def _km_parts(metres):
@@ -560,8 +823,14 @@ def _km_parts(metres):
 def _find_OSTN_shifts_at(easting, northing):
     '''Get the OSTN shifted at a pseudo grid reference.
 
+    Returns an immutable (dx, dy) tuple, or None outside the OSTN polygon.
+    Callers may hold on to the result, or unpack it into floats, without
+    copying it.
+
     >>> print("{:.5f} {:.5f}".format(*_find_OSTN_shifts_at(331439.160, 431992.943)))
     95.40442 -72.14955
+    >>> type(_find_OSTN_shifts_at(331439.160, 431992.943))
+    <class 'tuple'>
 
     >>> print("{:.5f} {:.5f}".format(*_find_OSTN_shifts_at(91400.00044, 11399.99932))) # TP01
     92.14556 -81.19532
@@ -645,132 +914,246 @@ def _find_OSTN_shifts_at(easting, northing):
     101.08994 -51.39455
     '''
 
-    if not 0 < easting < 700000:
-        return None
-
-    if not 0 < northing < 1250000:
+    if not (0 < easting < OSTN_E_MAX and 0 < northing < OSTN_N_MAX):
         return None
 
     east_km, t = _km_parts(easting)
     north_km, u = _km_parts(northing)
 
-    lle = (OSTN_EE_BASE + OSTN_EE_SHIFTS[east_km + north_km * 701]) / 1000
-    lre = (OSTN_EE_BASE + OSTN_EE_SHIFTS[east_km + north_km * 701 + 1]) / 1000
-    ule = (OSTN_EE_BASE + OSTN_EE_SHIFTS[east_km + north_km * 701 + 701]) / 1000
-    ure = (OSTN_EE_BASE + OSTN_EE_SHIFTS[east_km + north_km * 701 + 702]) / 1000
+    return _blend_OSTN(_OSTN_corners(east_km + north_km * OSTN_COLUMNS), t, u)
+
+
+def _OSTN_corners(ll):
+    '''Fetch the raw OSTN offsets at the corners of the km cell with SW node ll.
+
+    The result is the (ll, lr, ul, ur) offsets for eastings followed by the
+    same four for northings, which is what _blend_OSTN expects.
+
+    >>> len(_OSTN_corners(331 + 431 * OSTN_COLUMNS))
+    8
+    '''
+    ul = ll + OSTN_COLUMNS
+    return (OSTN_EE_SHIFTS[ll], OSTN_EE_SHIFTS[ll + 1], OSTN_EE_SHIFTS[ul], OSTN_EE_SHIFTS[ul + 1],
+            OSTN_NN_SHIFTS[ll], OSTN_NN_SHIFTS[ll + 1], OSTN_NN_SHIFTS[ul], OSTN_NN_SHIFTS[ul + 1])
+
+
+def _blend_OSTN(corners, t, u):
+    '''Interpolate the (dx, dy) shifts in metres from the corners of a km cell.
+
+    ``corners`` comes from _OSTN_corners, and ``t`` and ``u`` are the
+    fractional km east and north of the SW corner.  This is the only
+    place the bilinear blend is written out.
 
-    lln = (OSTN_NN_BASE + OSTN_NN_SHIFTS[east_km + north_km * 701]) / 1000
-    lrn = (OSTN_NN_BASE + OSTN_NN_SHIFTS[east_km + north_km * 701 + 1]) / 1000
-    uln = (OSTN_NN_BASE + OSTN_NN_SHIFTS[east_km + north_km * 701 + 701]) / 1000
-    urn = (OSTN_NN_BASE + OSTN_NN_SHIFTS[east_km + north_km * 701 + 702]) / 1000
+    >>> _blend_OSTN((0, 1000, 0, 1000, 0, 0, 2000, 2000), 0.5, 0.25)
+    (82.64, -83.68)
+    '''
+    (ee_ll, ee_lr, ee_ul, ee_ur, nn_ll, nn_lr, nn_ul, nn_ur) = corners
+
+    # The shifts are stored as offsets in mm from a fixed base, and the four
+    # weights add up to one, so we can interpolate the raw offsets and then
+    # add the base and convert to metres just once for each direction.
+    w_ll = (1 - t) * (1 - u)
+    w_lr = t * (1 - u)
+    w_ul = (1 - t) * u
+    w_ur = t * u
 
     return (
-        (1 - t) * (1 - u) * lle + t * (1 - u) * lre + (1 - t) * u * ule + t * u * ure,
-        (1 - t) * (1 - u) * lln + t * (1 - u) * lrn + (1 - t) * u * uln + t * u * urn
+        (OSTN_EE_BASE + w_ll * ee_ll + w_lr * ee_lr + w_ul * ee_ul + w_ur * ee_ur) / 1000,
+        (OSTN_NN_BASE + w_ll * nn_ll + w_lr * nn_lr + w_ul * nn_ul + w_ur * nn_ur) / 1000
     )
 
 
-def _llh_to_cartesian(lat, lon, H, model):
-    '''Approximate conversion from spherical to plane coordinates.
+def _cache_OSTN_shifts(maxsize):
+    '''Return a version of _find_OSTN_shifts_at that memoizes the km cells.
 
-    Used as part of the Helmert transformation used outside the OSTN02
-    area.
+    The cache holds the eight corner values of each km cell that has been
+    looked at, and the shifts are still interpolated at the true point, so
+    the results are exactly the same as from _find_OSTN_shifts_at.
 
-    >>> tuple(round(x, 8) for x in _llh_to_cartesian(53, -3, 10, 'OSGB36'))
-    (3841039.20164899, -201300.33469753, 5070178.45388073)
+    >>> cached = _cache_OSTN_shifts(16)
+    >>> print("{:.5f} {:.5f}".format(*cached(331439.160, 431992.943)))
+    95.40442 -72.14955
+    >>> points = [(331439.160, 431992.943), (331439.1601, 431992.9429), (331900.5, 431000.25)]
+    >>> all(cached(e, n) == _find_OSTN_shifts_at(e, n) for (e, n) in points)
+    True
+    >>> cached(-100, -100) is None
+    True
 
-    >>> (x, y, z) =  _llh_to_cartesian(52, 1, 30, 'WGS84')
-    >>> tuple(round(x, 8) for x in _cartesian_to_llh(x, y, z, 'WGS84'))
-    (52.0, 1.0, 30.0)
+    '''
+    corners = functools.lru_cache(maxsize=maxsize)(_OSTN_corners)
 
-    Note that you dont get more that 8 places of precision here.  Hence
-    the `round(x, 8)` in the test. But that gives you precision to
-    within 1mm which was the design point originally chosen by the OSGB.
+    def _find_cached(easting, northing):
+        if not (0 < easting < OSTN_E_MAX and 0 < northing < OSTN_N_MAX):
+            return None
 
-    Numbers from the worked example in the OSGB guide
+        east_km, t = _km_parts(easting)
+        north_km, u = _km_parts(northing)
+        return _blend_OSTN(corners(east_km + north_km * OSTN_COLUMNS), t, u)
 
-    e2 == 6.6705397616E-03
-    nu == 6.3910506260E+06
+    return _find_cached
 
-    >>> t = _llh_to_cartesian(52 + 39/60 + 27.2531/3600, 1 + 43/60 + 4.5177/3600, 24.700, 'OSGB36')
-    >>> tuple(round(x, 4) for x in t)
-    (3874938.8497, 116218.6238, 5047168.2073)
 
-    Note that here we have rounded to 4 places because these are in
-    units of metres rather than degrees.
+# The OSTN lookup used by the conversions; see OSGB_OSTN_CACHE above.
+_lookup_OSTN_shifts = _cache_OSTN_shifts(OSTN_CACHE_SIZE) if OSTN_CACHE_SIZE > 0 else _find_OSTN_shifts_at
+
+
+def _converge_OSTN(easting, northing):
+    '''Find the pseudo grid point that OSTN shifts on to (easting, northing).
+
+    This is the inverse of the shift applied by ll_to_grid, so it has to
+    be found by fixed-point iteration.  This loop is the inner loop of
+    every WGS84 grid_to_ll call, so it keeps the corners of the current km
+    cell rather than calling _find_OSTN_shifts_at on each pass.
+
+    Returns None if the iteration takes us outside the OSTN polygon.
+
+    >>> print("{:.3f} {:.3f}".format(*_converge_OSTN(331534.564, 431920.793)))
+    331439.160 431992.943
+
+    >>> _converge_OSTN(-100, -100) is None
+    True
 
     '''
-    a, _, _, e2 = ELLIPSOID_MODELS[model]
+    shifts = _lookup_OSTN_shifts(easting, northing)
+    if shifts is None:
+        return None
 
-    phi = lat / 57.29577951308232087679815481410517
-    sp = math.sin(phi)
-    cp = math.cos(phi)
+    (last_dx, last_dy) = shifts
+    x = easting - last_dx
+    y = northing - last_dy
 
-    lam = lon / 57.29577951308232087679815481410517
-    sl = math.sin(lam)
-    cl = math.cos(lam)
+    # The shifts move by less than a metre from one pass to the next, so
+    # we nearly always stay in the same km cell, and can keep its corners.
+    cell = -1
+    for _ in range(20):
+        if not (0 < x < OSTN_E_MAX and 0 < y < OSTN_N_MAX):
+            # we have been shifted off the edge
+            return None
 
-    nu = a / math.sqrt(1 - e2 * sp * sp)
+        east_km, t = _km_parts(x)
+        north_km, u = _km_parts(y)
 
-    return (
-        (nu + H) * cp * cl,
-        (nu + H) * cp * sl,
-        ((1 - e2) * nu + H) * sp
-    )
+        ll = east_km + north_km * OSTN_COLUMNS
+        if ll != cell:
+            (cell, corners) = (ll, _OSTN_corners(ll))
+
+        (dx, dy) = _blend_OSTN(corners, t, u)
+
+        x = easting - dx
+        y = northing - dy
+        ddx = dx - last_dx
+        ddy = dy - last_dy
+        if ddx * ddx + ddy * ddy < 1e-8:  # moved less than 0.1mm
+            break
+
+        (last_dx, last_dy) = (dx, dy)
 
+    return (x, y)
 
-def _cartesian_to_llh(x, y, z, model):
+
+def _cartesian_to_llh(x, y, z, model, fast=True):
     '''Approximate conversion from plane to spherical coordinates.
 
-    Used as part of the Helmert transformation used outside the OSTN02
-    area.
+    The Helmert transformation used outside the OSTN area does this step
+    inline in _helmert_shift_ll, with Bowring's closed form for the
+    latitude.  This is the same step as a routine on its own, so that the
+    closed form can be checked against the full iterative solution.
 
     >>> t = _cartesian_to_llh(3841039.2016489909, -201300.3346975291, 5070178.453880735, 'OSGB36')
     >>> tuple(round(x, 8) for x in t)
     (53.0, -3.0, 10.0)
+
+    By default this uses Bowring's closed form for the latitude, which
+    agrees with the full iterative solution to better than 1e-12 degrees
+    for points anywhere near the surface of the earth.  Set ``fast=False``
+    to get the iterative solution instead.
+
+    >>> t = _cartesian_to_llh(3841039.2016489909, -201300.3346975291, 5070178.453880735, 'OSGB36', fast=False)
+    >>> tuple(round(x, 8) for x in t)
+    (53.0, -3.0, 10.0)
     '''
 
-    a, _, _, e2 = ELLIPSOID_MODELS[model]
+    a, b, _, e2 = ELLIPSOID_MODELS[model]
 
-    p = math.sqrt(x * x + y * y)
+    p = math.hypot(x, y)
     lam = math.atan2(y, x)
-    phi = math.atan2(z, p * (1 - e2))
 
-    while True:
+    if fast:
+        theta = math.atan2(z * a, p * b)
+        st = math.sin(theta)
+        ct = math.cos(theta)
+        phi = math.atan2(z + e2 / (1 - e2) * b * st * st * st, p - e2 * a * ct * ct * ct)
         sp = math.sin(phi)
         nu = a / math.sqrt(1 - e2 * sp * sp)
-        oldphi = phi
-        phi = math.atan2(z + e2 * nu * sp, p)
-        if abs(oldphi - phi) < 1E-12:
-            break
+
+    else:
+        phi = math.atan2(z, p * (1 - e2))
+        while True:
+            sp = math.sin(phi)
+            nu = a / math.sqrt(1 - e2 * sp * sp)
+            oldphi = phi
+            phi = math.atan2(z + e2 * nu * sp, p)
+            if abs(oldphi - phi) < 1E-12:
+                break
 
     return (
-        phi * 57.29577951308232087679815481410517,
-        lam * 57.29577951308232087679815481410517,
+        phi * RAD2DEG,
+        lam * RAD2DEG,
         p / math.cos(phi) - nu
     )
 
 
-def _small_Helmert_transform_for_OSGB(direction, xa, ya, za):
-    '''Transform 3d planar coordinates to approximate OSGB36 to WGS84.
+def _helmert_shift_ll(lat, lon, source, helmert, target):
+    '''Move (lat, lon) from one ellipsoid to the other with a Helmert transformation.
 
-    Formulae as supplied by the OSGB.  Designed for +/- 5m accuracy in
-    most of OSGB area.
+    The point is turned into cartesian coordinates on the ``source``
+    ellipsoid with the height taken as zero, moved with the small Helmert
+    transformation supplied by the OSGB, which is designed for +/- 5m
+    accuracy in most of the OSGB area, and then turned back into latitude
+    and longitude on the ``target`` ellipsoid using Bowring's closed form
+    for the latitude, as in the default path of _cartesian_to_llh; the
+    iterative solution there, with ``fast=False``, is what test_helmert.py
+    checks this routine against.  The height is not computed for the result.
+    ``source`` and ``target`` are entries from ELLIPSOID_MODELS and
+    ``helmert`` is one of the HELMERT_TO_* tuples.
 
-    `direction` indicates the desired transformation: -1 -> WGS84, +1 -> OSGB36
+    >>> lat, lon = _helmert_shift_ll(52, -2, ELLIPSOID_MODELS['OSGB36'], HELMERT_TO_WGS84, ELLIPSOID_MODELS['WGS84'])
+    >>> print('{:.9f} {:.9f}'.format(lat, lon))
+    52.000424857 -2.001410469
+
+    With a transformation that does nothing, you get back where you started,
+    to better than 1e-8 degrees, which is well within 1mm.
+
+    >>> identity = (0, 0, 0, 1, 0, 0, 0)
+    >>> tuple(round(x, 8) for x in _helmert_shift_ll(53, -3, OSGB36_ELLIPSOID, identity, OSGB36_ELLIPSOID))
+    (53.0, -3.0)
+    >>> tuple(round(x, 8) for x in _helmert_shift_ll(52, 1, WGS84_ELLIPSOID, identity, WGS84_ELLIPSOID))
+    (52.0, 1.0)
 
     '''
-    tx = direction * -446.448
-    ty = direction * +125.157
-    tz = direction * -542.060
-    sp = direction * 0.0000204894 + 1
-    rx = (direction * -0.1502 / 3600) / 57.29577951308232087679815481410517
-    ry = (direction * -0.2470 / 3600) / 57.29577951308232087679815481410517
-    rz = (direction * -0.8421 / 3600) / 57.29577951308232087679815481410517
-    xb = tx + sp * xa - rz * ya + ry * za
-    yb = ty + rz * xa + sp * ya - rx * za
-    zb = tz - ry * xa + rx * ya + sp * za
-    return (xb, yb, zb)
+    (a, _, _, e2) = source
+    phi = lat * DEG2RAD
+    sp = math.sin(phi)
+    cp = math.cos(phi)
+    lam = lon * DEG2RAD
+    nu = a / math.sqrt(1 - e2 * sp * sp)
+    xa = nu * cp * math.cos(lam)
+    ya = nu * cp * math.sin(lam)
+    za = (1 - e2) * nu * sp
+
+    (tx, ty, tz, s, rx, ry, rz) = helmert
+    xb = tx + s * xa - rz * ya + ry * za
+    yb = ty + rz * xa + s * ya - rx * za
+    zb = tz - ry * xa + rx * ya + s * za
+
+    (a, b, _, e2) = target
+    p = math.hypot(xb, yb)
+    theta = math.atan2(zb * a, p * b)
+    st = math.sin(theta)
+    ct = math.cos(theta)
+    phi = math.atan2(zb + e2 / (1 - e2) * b * st * st * st, p - e2 * a * ct * ct * ct)
+
+    return (phi * RAD2DEG, math.atan2(yb, xb) * RAD2DEG)
 
 
 def _shift_ll_from_osgb36_to_wgs84(lat, lon):
@@ -781,10 +1164,7 @@ def _shift_ll_from_osgb36_to_wgs84(lat, lon):
     >>> tuple(round(x, 9) for x in _shift_ll_from_osgb36_to_wgs84(52, -2))
     (52.000424857, -2.001410469)
     '''
-    (xa, ya, za) = _llh_to_cartesian(lat, lon, 0, 'OSGB36')
-    (xb, yb, zb) = _small_Helmert_transform_for_OSGB(-1, xa, ya, za)
-    (latx, lonx, _) = _cartesian_to_llh(xb, yb, zb, 'WGS84')
-    return (latx, lonx)
+    return _helmert_shift_ll(lat, lon, OSGB36_ELLIPSOID, HELMERT_TO_WGS84, WGS84_ELLIPSOID)
 
 
 def _shift_ll_from_wgs84_to_osgb36(lat, lon):
@@ -794,7 +1174,4 @@ def _shift_ll_from_wgs84_to_osgb36(lat, lon):
     >>> tuple(round(x, 7) for x in _shift_ll_from_wgs84_to_osgb36(52.000424857, -2.001410469))
     (52.0, -2.0)
     '''
-    (xa, ya, za) = _llh_to_cartesian(lat, lon, 0, 'WGS84')
-    (xb, yb, zb) = _small_Helmert_transform_for_OSGB(+1, xa, ya, za)
-    (latx, lonx, _) = _cartesian_to_llh(xb, yb, zb, 'OSGB36')
-    return (latx, lonx)
+    return _helmert_shift_ll(lat, lon, WGS84_ELLIPSOID, HELMERT_TO_OSGB36, OSGB36_ELLIPSOID)
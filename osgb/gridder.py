@@ -4,16 +4,15 @@
 This module provides functions to parse and format grid references, and
 to tell you which maps include a given reference.
 """
-from __future__ import division, print_function, unicode_literals
-
-import ast
 import collections
-import itertools
+import functools
+import json
 import math
 import pkgutil
 import re
 
-__all__ = ['format_grid', 'parse_grid', 'sheet_keys', 'get_sheet']
+__all__ = ['format_grid', 'format_grid_many', 'parse_grid', 'parse_grid_many',
+           'sheet_keys', 'sheet_keys_many', 'get_sheet', 'index_maps']
 
 GRID_SQ_LETTERS = 'VWXYZQRSTULMNOPFGHJKABCDE'
 GRID_SIZE = int(math.sqrt(len(GRID_SQ_LETTERS)))
@@ -23,6 +22,32 @@ MAJOR_GRID_SQ_EASTING_OFFSET = 2 * MAJOR_GRID_SQ_SIZE
 MAJOR_GRID_SQ_NORTHING_OFFSET = 1 * MAJOR_GRID_SQ_SIZE
 MAX_GRID_SIZE = MINOR_GRID_SQ_SIZE * len(GRID_SQ_LETTERS)
 
+# position of each grid square letter in GRID_SQ_LETTERS, in either case
+_SQ_LETTER_INDEX = dict((c, i) for (i, c) in enumerate(GRID_SQ_LETTERS))
+_SQ_LETTER_INDEX.update((c.lower(), i) for (i, c) in enumerate(GRID_SQ_LETTERS))
+
+# the two letter name of every 100km square, indexed by x + y * GRID_SIZE**2
+# where x and y count 100km squares from the false origin of the lettering
+_SQ_TABLE = tuple(
+    GRID_SQ_LETTERS[x // GRID_SIZE + GRID_SIZE * (y // GRID_SIZE)]
+    + GRID_SQ_LETTERS[x % GRID_SIZE + GRID_SIZE * (y % GRID_SIZE)]
+    for y in range(GRID_SIZE * GRID_SIZE) for x in range(GRID_SIZE * GRID_SIZE)
+)
+
+# scale factors for grid references with 0 to 5 figures in each of E and N
+_POW10 = (1, 10, 100, 1000, 10000, 100000)
+
+# the forms accepted by format_grid, after the fast paths
+_FORM_RE = re.compile(r'S{1,2}(\s*)(E{1,5})(\s*)(N{1,5})')
+
+# map sheet references for parse_grid; _split_plain_sheet_reference
+# handles the plain Landranger ones with _ASCII_DIGITS instead of the regex
+_SHEET_REF_RE = re.compile(r'^([A-Z]:)?([0-9NEWSOL/]+?)(\.[a-z]+)?(?:[ -/.]([ 0-9]+))?$')
+_ASCII_DIGITS = '0123456789'
+
+# the runs of digits in the numeric part of a grid reference
+_DIGITS_RE = re.compile(r'(\d+)')
+
 
 def get_sheet(key):
     '''Fetch a map from the locker:
@@ -79,10 +104,10 @@ def _load_maps(series, filename):
             number = sheet
 
         maps[key] = Sheet(
-            ast.literal_eval(bbox),
+            json.loads(bbox),
             float(area),
             series, number, parent, title,
-            ast.literal_eval(polygon)
+            json.loads(polygon)
         )
 
     return maps
@@ -188,40 +213,142 @@ class FarFarAwayError(GridFormatError):
             + " is too far from the OSGB grid"
 
 
-def _is_left_right_or_on(x, y, a, b):
-    '''Is the point (x, y) left of, right of, or on the line from a to b?
-    Left: > 0, On: == 0, Right: < 0
+def _polygon_edges(poly):
+    '''Turn a closed list of vertices into a tuple of edges for _winding_number.
 
-    >>> _is_left_right_or_on(0, 0, (42,-4), (42, +4)) > 0
-    True
-    >>> _is_left_right_or_on(0, 0, (0, 42), (0, -42)) == 0
-    True
-    >>> _is_left_right_or_on(0, 0, (-42,-4), (-42, +4)) < 0
-    True
+    Each edge is (ax, ay, dx, dy, by), where (ax, ay) is its start, (dx, dy)
+    runs to its end, and by is the end northing, so the differences are
+    worked out once per sheet rather than once per test.
+
+    >>> _polygon_edges([(0, 0), (10, 0), (10, 10)])
+    ((0, 0, 10, 0, 0), (10, 0, 0, 10, 10))
     '''
-    return (b[0] - a[0]) * (y - a[1]) - (x - a[0]) * (b[1] - a[1])
+    return tuple((a[0], a[1], b[0] - a[0], b[1] - a[1], b[1]) for (a, b) in zip(poly, poly[1:]))
 
 
-def _pairwise(iterable):
-    # _pairwise('ABCDEFG') --> AB BC CD DE EF FG
-    a, b = itertools.tee(iterable)
-    next(b, None)
-    return zip(a, b)
+def _winding_number(x, y, edges):
+    '''This is adapted from http://geomalgorithms.com/a03-_inclusion.html
 
+    The edges come from _polygon_edges, and the is-left test for the point
+    against each edge is written out in line, since this loop dominates the
+    time spent in sheet_keys.
 
-def _winding_number(x, y, poly):
-    '''This is adapted from http://geomalgorithms.com/a03-_inclusion.html'''
+    >>> square = [(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)]
+    >>> _winding_number(5, 5, _polygon_edges(square))
+    1
+    >>> _winding_number(5, 5, _polygon_edges(square[::-1]))
+    -1
+    >>> _winding_number(15, 5, _polygon_edges(square))
+    0
+    '''
     w = 0
-    for a, b in _pairwise(poly):
-        if a[1] <= y:
-            if b[1] > y and _is_left_right_or_on(x, y, a, b) > 0:
+    for (ax, ay, dx, dy, by) in edges:
+        if ay <= y:
+            if by > y and dx * (y - ay) > (x - ax) * dy:
                 w += 1
-        else:
-            if b[1] <= y and _is_left_right_or_on(x, y, a, b) < 0:
-                w -= 1
+        elif by <= y and dx * (y - ay) < (x - ax) * dy:
+            w -= 1
     return w
 
 
+def _is_bbox(edges, bbox):
+    '''Is the polygon with these edges just the rectangle of its bbox?
+
+    >>> bbox = ((0, 0), (10, 10))
+    >>> _is_bbox(_polygon_edges([(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)]), bbox)
+    True
+    >>> _is_bbox(_polygon_edges([(0, 0), (10, 0), (10, 10), (5, 10), (0, 0)]), bbox)
+    False
+    >>> _is_bbox(_polygon_edges([(0, 0), (10, 0), (0, 0), (10, 0), (0, 0)]), bbox)
+    False
+    '''
+    ((x0, y0), (x1, y1)) = bbox
+    return len(edges) == 4 and all(
+        ax in (x0, x1) and ay in (y0, y1) and (dx == 0) != (dy == 0) and (dx == 0) != (edges[i - 1][2] == 0)
+        for (i, (ax, ay, dx, dy, by)) in enumerate(edges)
+    )
+
+
+# A flat copy of the bounding boxes, built by index_maps, so that sheet_keys
+# can reject sheets with four comparisons on local names rather than a dict
+# traversal and a chain of namedtuple lookups per sheet.  The polygon edges
+# for the winding number test are prepared here too, except for sheets that
+# are simply their bbox, where they are None and the test is skipped.  The
+# entries are then filed by the 10km cells their bounding boxes touch, so
+# that a lookup only has to look at the handful of sheets near the point.
+# They are kept in key order, so the sheets found come out already sorted.
+_SHEET_CELL_SIZE = 10000
+
+
+def _index_sheet_cells(index, size):
+    '''File the entries of a sheet index under each cell their bbox touches.
+
+    The keys are (easting // size, northing // size) so a float point finds
+    the same cell as an integer one.
+
+    >>> cells = _index_sheet_cells([('X:1', 'X', 5, 5, 25, 15, ())], 10)
+    >>> sorted(cells)
+    [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)]
+    >>> cells[(2.0, 1.0)][0][0]
+    'X:1'
+    >>> sorted(_index_sheet_cells([('X:2', 'X', 0.5, 0.5, 10.5, 9.5, ())], 10))
+    [(0, 0), (1, 0)]
+    '''
+    cells = collections.defaultdict(list)
+    for entry in index:
+        (x0, y0, x1, y1) = entry[2:6]
+        for i in range(int(math.floor(x0 / size)), int(math.floor(x1 / size)) + 1):
+            for j in range(int(math.floor(y0 / size)), int(math.floor(y1 / size)) + 1):
+                cells[(i, j)].append(entry)
+    return {c: tuple(entries) for (c, entries) in cells.items()}
+
+
+def index_maps():
+    """Rebuild the sheet index used by :py:func:`sheet_keys` from ``map_locker``.
+
+    The index is built once when the module is loaded, so if you add,
+    change, or remove sheets in ``map_locker`` afterwards, call this to
+    make ``sheet_keys`` and ``sheet_keys_many`` see the new sheets.
+
+    >>> map_locker['X:1'] = Sheet([[0, 0], [1000, 1000]], 1, 'X', '1', '', 'Test',
+    ...                           [[0, 0], [1000, 0], [1000, 1000], [0, 1000], [0, 0]])
+    >>> sheet_keys(500, 500, series='X')
+    []
+    >>> index_maps()
+    >>> sheet_keys(500, 500, series='X')
+    ['X:1']
+    >>> del map_locker['X:1']
+    >>> index_maps()
+    >>> sheet_keys(500, 500, series='X')
+    []
+
+    Sheets with fractional bounding boxes are indexed too.
+
+    >>> map_locker['X:2'] = Sheet([[0.5, 0.5], [1000.5, 1000.5]], 1, 'X', '2', '', 'Test',
+    ...                           [[0.5, 0.5], [1000.5, 0.5], [1000.5, 1000.5], [0.5, 1000.5], [0.5, 0.5]])
+    >>> index_maps()
+    >>> sheet_keys(1000.25, 1000.25, series='X')
+    ['X:2']
+    >>> del map_locker['X:2']
+    >>> index_maps()
+
+    """
+    global _SHEET_EDGES, _SHEET_INDEX, _SHEET_CELLS
+    edges = {k: _polygon_edges(m.polygon) for (k, m) in map_locker.items()}
+    index = tuple(
+        (k, k[0], m.bbox[0][0], m.bbox[0][1], m.bbox[1][0], m.bbox[1][1],
+         None if _is_bbox(edges[k], m.bbox) else edges[k])
+        for (k, m) in sorted(map_locker.items())
+    )
+    cells = _index_sheet_cells(index, _SHEET_CELL_SIZE)
+
+    # only swap in the new index once all of it has been built
+    (_SHEET_EDGES, _SHEET_INDEX, _SHEET_CELLS) = (edges, index, cells)
+
+
+index_maps()
+
+
 def format_grid(easting, northing=None, form='SS EEE NNN'):
     """Formats an (easting, northing) pair into traditional grid reference.
 
@@ -328,42 +455,105 @@ def format_grid(easting, northing=None, form='SS EEE NNN'):
     if northing is None:
         (easting, northing) = easting
 
+    (sq, e, n) = _square_and_offsets(easting, northing)
+
+    # special cases, including the two common forms done directly
+    ff = form.upper()
+    if ff == 'SS EEE NNN' or ff == 'TRAD':
+        return '{0} {1:03d} {2:03d}'.format(sq, e // 100, n // 100)
+    elif ff == 'SS EEEEE NNNNN' or ff == 'GPS':
+        return '{0} {1:05d} {2:05d}'.format(sq, e, n)
+    elif ff == 'SS':
+        return sq
+
+    spec = _parse_form(ff)
+    if spec is None:
+        raise FaultyFormError(form)
+
+    (template, e_scale, n_scale) = spec
+    return template.format(sq, e // e_scale, n // n_scale)
+
+
+def format_grid_many(eastings, northings, form='SS EEE NNN'):
+    """Format sequences of eastings and northings into a list of grid references.
+
+    This is the batch version of :py:func:`format_grid`.  Each string is
+    exactly what ``format_grid`` would return for that point, but the form
+    is worked out only once for the whole list.
+
+    >>> format_grid_many([438710.908, 460003], [114792.248, 180542])
+    ['SU 387 147', 'SU 600 805']
+    >>> format_grid_many([438710.908, 460003], [114792.248, 180542], form='SSEENN')
+    ['SU3814', 'SU6080']
+
+    """
+    spec = _parse_form(form.upper())
+    if spec is None:
+        raise FaultyFormError(form)
+
+    (template, e_scale, n_scale) = spec
+
+    result = list()
+    for (easting, northing) in zip(eastings, northings):
+        (sq, e, n) = _square_and_offsets(easting, northing)
+        result.append(template.format(sq, e // e_scale, n // n_scale))
+
+    return result
+
+
+def _square_and_offsets(easting, northing):
+    '''Find the 100km square letters and the whole metre offsets within it.
+
+    This is the part of format_grid shared with format_grid_many.
+
+    >>> _square_and_offsets(438710.908, 114792.248)
+    ('SU', 38710, 14792)
+    >>> _square_and_offsets(-1000001, 0) # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+        ...
+    FarFarAwayError: -1000001 0
+    '''
     e = easting + MAJOR_GRID_SQ_EASTING_OFFSET
     n = northing + MAJOR_GRID_SQ_NORTHING_OFFSET
 
     if 0 <= e < MAX_GRID_SIZE and 0 <= n < MAX_GRID_SIZE:
-        major_index = int(e / MAJOR_GRID_SQ_SIZE) + GRID_SIZE * int(n / MAJOR_GRID_SQ_SIZE)
-        e = e % MAJOR_GRID_SQ_SIZE
-        n = n % MAJOR_GRID_SQ_SIZE
-        minor_index = int(e / MINOR_GRID_SQ_SIZE) + GRID_SIZE * int(n / MINOR_GRID_SQ_SIZE)
-        sq = GRID_SQ_LETTERS[major_index] + GRID_SQ_LETTERS[minor_index]
-
+        sq = _SQ_TABLE[int(e // MINOR_GRID_SQ_SIZE + len(GRID_SQ_LETTERS) * (n // MINOR_GRID_SQ_SIZE))]
     else:
         raise FarFarAwayError(easting, northing)
 
-    e = int(easting % MINOR_GRID_SQ_SIZE)
-    n = int(northing % MINOR_GRID_SQ_SIZE)
+    return (sq, int(easting % MINOR_GRID_SQ_SIZE), int(northing % MINOR_GRID_SQ_SIZE))
 
-    # special cases
-    ff = form.upper()
+
+@functools.lru_cache(maxsize=64)
+def _parse_form(ff):
+    '''Turn an upper case form into (template, e_scale, n_scale), or None.
+
+    The template takes the square letters and the easting and northing
+    within the square after dividing them by the scales.  Callers use
+    only a few distinct forms, so the answers are cached.
+
+    >>> _parse_form('SS EEE NNN')
+    ('{0} {1:03d} {2:03d}', 100, 100)
+    >>> _parse_form('SSEENN')
+    ('{0}{1:02d}{2:02d}', 1000, 1000)
+    >>> _parse_form('GPS')
+    ('{0} {1:05d} {2:05d}', 1, 1)
+    >>> _parse_form('TT') is None
+    True
+    '''
     if ff == 'TRAD':
         ff = 'SS EEE NNN'
     elif ff == 'GPS':
         ff = 'SS EEEEE NNNNN'
     elif ff == 'SS':
-        return sq
+        return ('{0}', 1, 1)
 
-    m = re.match(r'S{1,2}(\s*)(E{1,5})(\s*)(N{1,5})', ff)
+    m = _FORM_RE.match(ff)
     if m is None:
-        raise FaultyFormError(form)
-
+        return None
     (space_a, e_spec, space_b, n_spec) = m.group(1, 2, 3, 4)
-    e = int(e / 10 ** (5 - len(e_spec)))
-    n = int(n / 10 ** (5 - len(n_spec)))
-
-    return sq \
-        + space_a + '{0:0{1}d}'.format(e, len(e_spec)) \
-        + space_b + '{0:0{1}d}'.format(n, len(n_spec))
+    template = '{0}' + space_a + '{1:0%dd}' % len(e_spec) + space_b + '{2:0%dd}' % len(n_spec)
+    return (template, _POW10[5 - len(e_spec)], _POW10[5 - len(n_spec)])
 
 
 def parse_grid(*grid_elements, **kwargs):
@@ -543,6 +733,30 @@ If there's no matching input then a GarbageError error is raised.
     else:
         grid_string = ' '.join(str(x).strip() for x in grid_elements)
 
+    return _parse_grid_string(grid_string)
+
+
+def parse_grid_many(grid_refs):
+    """Parse a sequence of grid reference strings into a list of (easting, northing) pairs.
+
+    This is the batch version of :py:func:`parse_grid` for the single
+    string form.  Each item is parsed exactly as ``parse_grid(item)``
+    would parse it, and raises the same errors, but without the argument
+    handling that ``parse_grid`` has to do on every call.
+
+    >>> parse_grid_many(['TA 123 678', 'SV9055710820', 'A:164/352194', 'TA'])
+    [(512300, 467800), (90557, 10820), (435200, 219400), (500000, 400000)]
+
+    """
+    return [_parse_grid_string(str(x).strip()) for x in grid_refs]
+
+
+def _parse_grid_string(grid_string):
+    '''Work out (easting, northing) from a grid reference string.
+
+    >>> _parse_grid_string('TA 123 678')
+    (512300, 467800)
+    '''
     # normal case : TQ 123 456 etc
     offsets = _get_grid_square_offsets(grid_string)
     if offsets is not None:
@@ -555,18 +769,52 @@ If there's no matching input then a GarbageError error is raised.
 
     # just a pair of numbers perhaps?
     try:
-        grid_elements = tuple(float(x) for x in grid_string.split())
+        (e, n) = grid_string.split()
+        return (float(e), float(n))
     except ValueError:
         pass
-    else:
-        if len(grid_elements) == 2:
-            return grid_elements
 
     # probably now a sheet name rather than a SQ number
     # so hand off to the sheet reference parser
     return _get_easting_northing_from_sheet_reference(grid_string)
 
 
+def _split_plain_sheet_reference(s):
+    '''Split a Landranger reference like "176/224711", "176 224 711", or "161"
+    into its sheet number and local grid reference without using the regex.
+
+    This is a shortcut for the commonest matches of _SHEET_REF_RE: a
+    reference with no series prefix and no suffix, whose groups would be
+    (None, sheet number, None, numbers).  So if you change the regex,
+    check that this still agrees with it.  It returns None for anything
+    else, which is then left to the regex.  Where it does return an answer
+    it is the same as the regex would give.
+
+    >>> _split_plain_sheet_reference('176/224711')
+    ('176', '224711')
+    >>> _split_plain_sheet_reference('164 513 62')
+    ('164', '513 62')
+    >>> _split_plain_sheet_reference('161')
+    ('161', None)
+    >>> _split_plain_sheet_reference('A:164/352194') is None
+    True
+    '''
+    if not s or s[0] not in _ASCII_DIGITS:
+        return None
+
+    (sheet_number, sep, numbers) = s.partition('/')
+    if not sep:
+        (sheet_number, sep, numbers) = s.partition(' ')
+
+    if sheet_number.strip(_ASCII_DIGITS):
+        return None
+    if not sep:
+        return (sheet_number, None)
+    if numbers and not numbers.strip(_ASCII_DIGITS + ' '):
+        return (sheet_number, numbers)
+    return None
+
+
 def _get_easting_northing_from_sheet_reference(possible_map_gr):
     '''Find a grid reference from a sheet number (with optional local GR)
 
@@ -580,20 +828,26 @@ def _get_easting_northing_from_sheet_reference(possible_map_gr):
 
     '''
 
-    # so lets try to decompose the string version of the input
-    ok = re.match(r'^([A-Z]:)?([0-9NEWSOL/]+?)(\.[a-z]+)?(?:[ -/.]([ 0-9]+))?$', possible_map_gr)
-    if not ok:
-        raise GarbageError(possible_map_gr)
-
-    (prefix, sheet_number, suffix, numbers) = ok.groups()
+    plain = _split_plain_sheet_reference(possible_map_gr)
+    if plain is not None:
+        (sheet_number, numbers) = plain
+        sheet = "A:" + sheet_number
 
-    if prefix is None:
-        sheet = "A:" + sheet_number  # default to Landranger sheets
     else:
-        sheet = prefix + sheet_number
+        # so lets try to decompose the string version of the input
+        ok = _SHEET_REF_RE.match(possible_map_gr)
+        if not ok:
+            raise GarbageError(possible_map_gr)
 
-    if suffix is not None:
-        sheet = sheet + suffix
+        (prefix, sheet_number, suffix, numbers) = ok.groups()
+
+        if prefix is None:
+            sheet = "A:" + sheet_number  # default to Landranger sheets
+        else:
+            sheet = prefix + sheet_number
+
+        if suffix is not None:
+            sheet = sheet + suffix
 
     s = get_sheet(sheet)
 
@@ -610,7 +864,8 @@ def _get_easting_northing_from_sheet_reference(possible_map_gr):
             raise GarbageError(numbers)
         easting = easting + (e - easting) % MINOR_GRID_SQ_SIZE
         northing = northing + (n - northing) % MINOR_GRID_SQ_SIZE
-        if _winding_number(easting, northing, s.polygon) == 0:
+        edges = _SHEET_EDGES.get(sheet) or _polygon_edges(s.polygon)
+        if _winding_number(easting, northing, edges) == 0:
             raise SheetMismatchError(sheet, easting, northing)
 
     return (easting, northing)
@@ -628,26 +883,29 @@ def _get_grid_square_offsets(sq):
     >>> _get_grid_square_offsets('') is None
     True
 
-    """
+    >>> _get_grid_square_offsets('tq') == _get_grid_square_offsets('TQ')
+    True
 
-    if len(sq) < 2:
-        return None
+    """
+    return _SQ_OFFSETS.get(sq[:2])
 
-    a = GRID_SQ_LETTERS.find(sq[0].upper())
-    if a < 0:
-        return None
 
-    b = GRID_SQ_LETTERS.find(sq[1].upper())
-    if b < 0:
-        return None
+def _sq_offsets():
+    '''Work out the (e, n) of the ll corner of every grid square, keyed by
+    its two letters in any mixture of upper and lower case.'''
+    offsets = dict()
+    for (first, a) in _SQ_LETTER_INDEX.items():
+        (Y, X) = divmod(a, GRID_SIZE)
+        for (second, b) in _SQ_LETTER_INDEX.items():
+            (y, x) = divmod(b, GRID_SIZE)
+            offsets[first + second] = (
+                MAJOR_GRID_SQ_SIZE * X - MAJOR_GRID_SQ_EASTING_OFFSET + MINOR_GRID_SQ_SIZE * x,
+                MAJOR_GRID_SQ_SIZE * Y - MAJOR_GRID_SQ_NORTHING_OFFSET + MINOR_GRID_SQ_SIZE * y
+            )
+    return offsets
 
-    (Y, X) = divmod(a, GRID_SIZE)
-    (y, x) = divmod(b, GRID_SIZE)
 
-    return (
-        MAJOR_GRID_SQ_SIZE * X - MAJOR_GRID_SQ_EASTING_OFFSET + MINOR_GRID_SQ_SIZE * x,
-        MAJOR_GRID_SQ_SIZE * Y - MAJOR_GRID_SQ_NORTHING_OFFSET + MINOR_GRID_SQ_SIZE * y
-    )
+_SQ_OFFSETS = _sq_offsets()
 
 
 def _get_eastings_northings(s):
@@ -658,22 +916,22 @@ def _get_eastings_northings(s):
     >>> _get_eastings_northings(' 234 567')
     (23400, 56700)
     """
-    t = re.findall(r'(\d+)', s)
+    t = _DIGITS_RE.findall(s)
     if len(t) == 2:
         (e, n) = t
+        figs = max(len(e), len(n))
     elif len(t) == 1:
         gr = t[0]
-        f = len(gr)
-        if f in [2, 4, 6, 8, 10]:
-            f = int(f / 2)
-            e, n = (gr[:f], gr[f:])
-        else:
+        figs = len(gr)
+        if figs & 1 or figs > 10:
             return None
+        figs >>= 1
+        (e, n) = (gr[:figs], gr[figs:])
     else:
         return None
 
-    figs = min(5, max(len(e), len(n)))
-    return (int(e) * 10 ** (5 - figs), int(n) * 10 ** (5 - figs))
+    scale = _POW10[5 - min(5, figs)]
+    return (int(e) * scale, int(n) * scale)
 
 
 def sheet_keys(easting, northing=None, series='ABCHJ'):
@@ -750,14 +1008,41 @@ def sheet_keys(easting, northing=None, series='ABCHJ'):
         else:
             return []
 
-    sheets = list()
-    for (k, m) in map_locker.items():
-        if k[0] not in series:  # initial letter of key is series letter
-            continue
+    return _sheet_keys_at(easting, northing, series)
+
+
+def sheet_keys_many(eastings, northings, series='ABCHJ'):
+    """Return a list of sheet key lists, one for each (easting, northing) point.
+
+    This is the batch version of :py:func:`sheet_keys`.  Each list is
+    exactly what ``sheet_keys`` would return for that point, but the
+    lookups are done in one loop without the argument handling.
+
+    >>> for keys in sheet_keys_many([314159, 0, 438710.908], [271828, 0, 114792.248], series='AB'):
+    ...     print(' '.join(keys))
+    A:136 A:148 B:200E B:214E
+    <BLANKLINE>
+    A:196 B:OL22E
 
-        if m.bbox[0][0] <= easting < m.bbox[1][0]:
-            if m.bbox[0][1] <= northing < m.bbox[1][1]:
-                if _winding_number(easting, northing, m.polygon) != 0:
-                    sheets.append(k)
+    """
+    return [_sheet_keys_at(easting, northing, series) for (easting, northing) in zip(eastings, northings)]
+
+
+def _sheet_keys_at(easting, northing, series):
+    '''Find the sorted keys of the sheets in series that include one point.
+
+    This is the part of sheet_keys shared with sheet_keys_many.  Only the
+    sheets filed under the point's 10km cell are looked at, and the
+    winding number test is skipped for sheets that are just their bbox.
+
+    >>> _sheet_keys_at(438710.908, 114792.248, 'A')
+    ['A:196']
+    '''
+    sheets = list()
+    cell = (easting // _SHEET_CELL_SIZE, northing // _SHEET_CELL_SIZE)
+    for (k, s, x0, y0, x1, y1, edges) in _SHEET_CELLS.get(cell, ()):
+        if x0 <= easting < x1 and y0 <= northing < y1 and s in series:
+            if edges is None or _winding_number(easting, northing, edges) != 0:
+                sheets.append(k)
 
-    return sorted(sheets)
+    return sheets
@@ -1,6 +1,4 @@
 #! /usr/bin/env python3
-from __future__ import division, print_function
-
 import argparse
 
 import osgb
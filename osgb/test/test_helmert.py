@@ -0,0 +1,54 @@
+'''
+Check the closed form used by the Helmert fallback against the exact
+iterative solution.
+'''
+
+import math
+
+import osgb
+
+
+def _cartesian(lat, lon, h, model):
+    "Plain llh to cartesian conversion on one of the ellipsoid models"
+    a, _, _, e2 = osgb.convert.ELLIPSOID_MODELS[model]
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    nu = a / math.sqrt(1 - e2 * math.sin(phi) ** 2)
+    return ((nu + h) * math.cos(phi) * math.cos(lam),
+            (nu + h) * math.cos(phi) * math.sin(lam),
+            ((1 - e2) * nu + h) * math.sin(phi))
+
+
+def test_bowring_agrees_with_iteration():
+    '''
+    Over the latitude range of the grid, and a bit beyond, Bowring's closed
+    form should agree with the iterative solution to about 1e-9 degrees.
+    '''
+    for model in ('OSGB36', 'WGS84'):
+        for lat in range(48, 64):
+            for lon in range(-12, 5, 2):
+                for h in (-100, 0, 1500):
+                    (x, y, z) = _cartesian(lat + 0.37, lon + 0.41, h, model)
+                    fast = osgb.convert._cartesian_to_llh(x, y, z, model)
+                    exact = osgb.convert._cartesian_to_llh(x, y, z, model, fast=False)
+                    assert abs(fast[0] - exact[0]) < 1e-9
+                    assert abs(fast[1] - exact[1]) < 1e-9
+
+
+def test_helmert_shift_agrees_with_iteration():
+    '''
+    The fused _helmert_shift_ll should land where the exact solution does.
+    '''
+    convert = osgb.convert
+    (tx, ty, tz, s, rx, ry, rz) = convert.HELMERT_TO_WGS84
+    for lat in range(48, 64):
+        for lon in range(-12, 5, 2):
+            (xa, ya, za) = _cartesian(lat + 0.37, lon + 0.41, 0, 'OSGB36')
+            xb = tx + s * xa - rz * ya + ry * za
+            yb = ty + rz * xa + s * ya - rx * za
+            zb = tz - ry * xa + rx * ya + s * za
+            exact = convert._cartesian_to_llh(xb, yb, zb, 'WGS84', fast=False)
+            shifted = convert._helmert_shift_ll(lat + 0.37, lon + 0.41, convert.OSGB36_ELLIPSOID,
+                                                convert.HELMERT_TO_WGS84, convert.WGS84_ELLIPSOID)
+            assert abs(shifted[0] - exact[0]) < 1e-9
+            assert abs(shifted[1] - exact[1]) < 1e-9
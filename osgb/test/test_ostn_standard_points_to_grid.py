@@ -6,8 +6,6 @@ which are rounded to the nearest mm, so should match exactly.
 
 Toby Thurston -- 23 Jan 2018
 """
-from __future__ import division, print_function
-
 import argparse
 import csv
 
@@ -36,6 +34,12 @@ def test_all(chatty=False):
         assert gr == expected_output[k]
 
 
+def test_all_as_arrays():
+    keys = sorted(test_input)
+    (ee, nn) = osgb.ll_to_grid_array((test_input[k][0] for k in keys), (test_input[k][1] for k in keys))
+    assert list(zip(ee, nn)) == [expected_output[k] for k in keys]
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--verbose", action="store_true")
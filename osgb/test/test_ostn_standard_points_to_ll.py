@@ -6,8 +6,6 @@ with an error of less that 0.02 mm
 
 Toby Thurston -- 22 Jan 2018
 """
-from __future__ import division, print_function
-
 import argparse
 import csv
 import math
@@ -52,6 +50,13 @@ def test_all(chatty=False):
         assert abs(delta_lon_mm) < acceptable_error_mm
 
 
+def test_all_as_arrays():
+    keys = sorted(test_input)
+    (lats, lons) = osgb.grid_to_ll_array((test_input[k][0] for k in keys), (test_input[k][1] for k in keys),
+                                         rounding=10)
+    assert list(zip(lats, lons)) == [osgb.grid_to_ll(test_input[k], rounding=10) for k in keys]
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--verbose", action="store_true")
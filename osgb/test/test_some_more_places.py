@@ -5,8 +5,6 @@ Toby Thurston  2017-10-28
 Test known locations convert correctly
 '''
 
-from __future__ import division
-
 import osgb
 
 
@@ -60,3 +58,18 @@ def test_grid_formatting():
 
 def test_greenwich():
     assert osgb.format_grid(osgb.ll_to_grid(lat=51.5, lon=0, model='OSGB36')) == 'TQ 388 798'
+
+
+def test_sheet_keys_many():
+    points = [osgb.parse_grid(gr) for gr in ('NM975948', 'NH073060', 'SX700682', 'TQ103606', 'HY554300')]
+    eastings = [e for (e, n) in points]
+    northings = [n for (e, n) in points]
+    assert osgb.sheet_keys_many(eastings, northings) == [osgb.sheet_keys(e, n) for (e, n) in points]
+    assert osgb.sheet_keys_many(eastings, northings, series='A') == [osgb.sheet_keys(p, series='A') for p in points]
+
+
+def test_grid_formatting_many():
+    refs = ['NM 975 948', 'NH 073 060', 'SX 700 682', 'TQ 103 606', 'HY 554 300']
+    points = osgb.parse_grid_many(refs)
+    assert points == [osgb.parse_grid(gr) for gr in refs]
+    assert osgb.format_grid_many([e for (e, n) in points], [n for (e, n) in points]) == refs
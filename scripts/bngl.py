@@ -7,8 +7,6 @@ Toby Thurston -- 10 Jun 2022
 """
 # allow free variable names and the occasional trailing whitespace character
 # pylint: disable=C0103, C0303
-from __future__ import division, print_function
-
 import argparse
 import random
 import re
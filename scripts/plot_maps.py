@@ -1,6 +1,4 @@
 '''Print a map of the National Grid, optionally with an index of OS maps'''
-from __future__ import division, print_function
-
 import argparse
 import math
 import os
@@ -6,8 +6,6 @@ Take a GPX file (route, track, etc), and find all the maps needed to cover it.
 
 """
 # pylint: disable=C0103
-from __future__ import division, print_function
-
 import argparse
 import collections
 
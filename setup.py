@@ -2,7 +2,7 @@ import setuptools
 
 setuptools.setup(
     name='osgb',
-    version='1.2.0',
+    version='2.0.0',
     description='osgb - high-precision geographic coordinate conversion for Great Britain, based on Ordnance Survey data',
     long_description="Python routines for working with grid references as defined by the Ordnance Survey of Great Britain (OSGB).",
     long_description_content_type="text/markdown",
@@ -11,6 +11,7 @@ setuptools.setup(
     author_email='toby@cpan.org',
     url='http://thurston.eml.cc',
     packages=['osgb'],
+    python_requires='>=3.5',
     package_data={'osgb': ['ostn_east_shift_82140', 'ostn_north_shift_-84180', 'gb_coastline.shapes',
                            'maps-explorer.txt', 'maps-harvey-mountain.txt', 'maps-harvey-superwalker.txt',
                            'maps-landranger.txt', 'maps-one-inch.txt', ]},
@@ -25,8 +26,8 @@ setuptools.setup(
         "Natural Language :: English",
         "Operating System :: OS Independent",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 2",
         "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
         "Topic :: Scientific/Engineering :: GIS",
     ],
     keywords='GIS geographic coordinates conversion',